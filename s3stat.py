@@ -118,8 +118,23 @@ a single class that you can subclass to process the results in json format.::
     mytask.run()
 
 Where the `aws_*` parameters are optional, if missing then they are taken from the environment variables as provided by boto.
-The process_error method currently is called only when the JSON decoding fails, thus `data` is the non-decodeable string, while
-exception is the ValueError raised by Python.
+The process_error method is called when the JSON decoding fails, thus `data` is the non-decodeable string, while
+exception is the ValueError raised by Python. It is called as well when goaccess exits with an error, in which case
+exception is a `subprocess.CalledProcessError`, and `data` is the output of goaccess.
+
+Several output formats can be generated from a single download when a list of formats is given to `run`.
+The goaccess reports are then created in parallel, and process_results is called once per format, with the format
+passed as the `format` keyword argument. If some of the reports fail, process_error is called for each of them,
+and the remaining reports are still passed to process_results. The default process_results implementation
+writes every report to an `s3output.<format>` file (`s3output.html` when no format is known)::
+
+    class MyS3Stat(s3stat.S3Stat):
+
+        def process_results(self, result, error=None, format=None):
+            print format, result
+
+    mytask = MyS3Stat(bucket, log_path, for_date, (aws_key, aws_secret))
+    mytask.run(["html", "json"])
 
 ToDo
 -----
@@ -199,6 +214,29 @@ class DownloadLogThread(threading.Thread):
                 continue
 
 
+class ReportThread(threading.Thread):
+    """
+    This thread runs a single goaccess report on the already concatenated log file,
+    and keeps its output for further processing
+    """
+
+    def __init__(self, command, format):
+        threading.Thread.__init__(self)
+        self.command = command
+        self.format = format
+        self.out = None
+        self.returncode = None
+        self.exception = None
+
+    def run(self):
+        try:
+            server = subprocess.Popen(self.command + ["-o", self.format], stdout=subprocess.PIPE)
+            self.out, err = server.communicate()
+            self.returncode = server.returncode
+        except Exception as e:
+            self.exception = e
+
+
 class S3Stat(object):
     """
     We download the log files from S3, then concatenate them, and pass the results to goaccess. It gives back a JSON
@@ -270,13 +308,18 @@ log_format AWSS3
                 del t
             logger.debug("Downloading of logs completed")
 
-    def process_results(self, json_obj, error=None):
+    def process_results(self, json_obj, error=None, format=None):
         """
         This is the main method to be overwritten by implementors.
 
+        By default the result is written to `s3output.<format>`, JSON objects are serialized first.
+
         :param json: A JSON object result from goaccess to be processed further.
+        :param format: the output format of the result, only given when a list of formats was passed to `run`
         """
-        open('s3output.html', 'w').write(json_obj)
+        if not isinstance(json_obj, basestring):
+            json_obj = json.dumps(json_obj)
+        open('s3output.%s' % (format or 'html'), 'w').write(json_obj)
         # logger.debug(json.dumps(json_obj))
 
     def process_error(self, exc, data=None):
@@ -298,28 +341,63 @@ log_format AWSS3
         In json format is requested, process_results is called with the corresponding JSON dict. Otherwise
         it's called with a simple string.
 
-        :param format: String optional, one of json, html or csv
+        Several formats might be given as a list, in which case the logs are downloaded only once, the reports
+        are generated in parallel, and process_results is called for every format with the `format` keyword argument.
+        A failing report is passed to process_error, and the remaining reports are processed nevertheless.
+        If goaccess could not be started at all, the exception is raised after every report finished.
+
+        :param format: String optional, one of json, html or csv, or a list of these
+        :returns: True on success, otherwise the value returned by the (last) process_error call
         """
+        is_list = not (format is None or isinstance(format, basestring))
+        if is_list:
+            formats = []
+            for f in format:
+                if f not in formats:
+                    formats.append(f)
+        else:
+            formats = [format] if format else []
         self._create_goconfig()
         with tempfile.NamedTemporaryFile() as tempLog:
             self.download_logs(tempLog)
             tempLog.flush()  # needed to have the temp file written for sure
             logger.debug("Creating report")
             command = ["goaccess", "-f", tempLog.name, "-p", self.configfile.name]
-            if format:
-                command += [ "-o", format]
-            server = subprocess.Popen(command, stdout=subprocess.PIPE if format else None)
-            out, err = server.communicate()
-        if format:
-            if format == "json":
-                try:
+            if not formats:
+                server = subprocess.Popen(command)
+                server.communicate()
+                return True
+            threads = [ReportThread(command, f) for f in formats]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        for t in threads:
+            if t.exception is not None:
+                raise t.exception
+
+        result = True
+        for t in threads:
+            out = t.out
+            try:
+                if t.returncode:
+                    raise subprocess.CalledProcessError(t.returncode, t.command + ["-o", t.format], out)
+                if t.format == "json":
                     out = json.loads(out)
-                except ValueError as e:
+            except (ValueError, subprocess.CalledProcessError) as e:
+                if not is_list:
                     return self.process_error(e, out)
+                logger.error('Error while creating the %s report', t.format)
+                result = self.process_error(e, out)
+                continue
 
-            self.process_results(out)
+            if is_list:
+                self.process_results(out, format=t.format)
+            else:
+                self.process_results(out)
 
-        return True
+        return result
 
 # def enable_logging(args):
 #     if args.aws_key and args.aws_secret:
@@ -342,7 +420,8 @@ if __name__ == "__main__":
     # Add logging related subcommand
     # parser.add_argument("--output_bucket", help="Output bucket for logging")
     # parser.add_argument("--output_prefix", help="Output prefix for generating log files in output bucket.", default="s3stat/access_log-")
-    parser.add_argument("-o", "--output", help="Output format. One of html, json or csv.", default=None)
+    parser.add_argument("-o", "--output", help="Output format. One of html, json or csv. Might be given several times.",
+                        action="append", default=None)
     parser.add_argument("-v", "--verbose", help="Verbose output", action="store_true", default=False)
     parser.add_argument("-d", "--date", help="The date to run the report on in YYYY-MM-DD format. Defaults to today.")
 
@@ -18,8 +18,8 @@ setup(
     install_requires=['boto', 'tempdir'],
     py_modules=['s3stat'],
     scripts=['s3stat.py'],
-    keywords="s3stat amazon statistics goaccess"
-    # tests_require=['pytest'],
+    keywords="s3stat amazon statistics goaccess",
+    tests_require=['mock'],
     # cmdclass = {
     #     'test': PyTest,
     # }
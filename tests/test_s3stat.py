@@ -0,0 +1,88 @@
+import subprocess
+import unittest
+from datetime import date
+
+import mock
+
+import s3stat
+
+OUTPUTS = {
+    "json": '{"general": {"total_requests": 1}}',
+    "html": "<html></html>",
+    "csv": "1,2,3",
+}
+
+
+def fake_popen(outputs=OUTPUTS, returncode=0):
+    def popen(command, stdout=None):
+        server = mock.Mock()
+        server.communicate.return_value = (outputs[command[command.index("-o") + 1]], None)
+        server.returncode = returncode
+        return server
+    return popen
+
+
+class RecordingS3Stat(s3stat.S3Stat):
+
+    def __init__(self, *args, **kwargs):
+        super(RecordingS3Stat, self).__init__(*args, **kwargs)
+        self.results = []
+        self.errors = []
+
+    def process_results(self, json_obj, error=None, format=None):
+        self.results.append((format, json_obj))
+
+    def process_error(self, exc, data=None):
+        self.errors.append((exc, data))
+        return False
+
+
+@mock.patch.object(s3stat.S3Stat, "download_logs")
+class MultiFormatRunTest(unittest.TestCase):
+
+    def setUp(self):
+        self.task = RecordingS3Stat("bucket", "logs/", date(2014, 1, 1))
+
+    def test_runs_goaccess_once_per_format(self, download_logs):
+        with mock.patch("s3stat.subprocess.Popen", side_effect=fake_popen()) as popen:
+            self.assertTrue(self.task.run(["html", "json", "csv", "json"]))
+        self.assertEqual(download_logs.call_count, 1)
+        formats = sorted(call[0][0][-1] for call in popen.call_args_list)
+        self.assertEqual(formats, ["csv", "html", "json"])
+
+    def test_process_results_receives_format(self, download_logs):
+        with mock.patch("s3stat.subprocess.Popen", side_effect=fake_popen()):
+            self.task.run(["html", "json", "csv"])
+        self.assertEqual(self.task.results, [
+            ("html", OUTPUTS["html"]),
+            ("json", {"general": {"total_requests": 1}}),
+            ("csv", OUTPUTS["csv"]),
+        ])
+
+    def test_single_format_list_passes_format(self, download_logs):
+        with mock.patch("s3stat.subprocess.Popen", side_effect=fake_popen()):
+            self.task.run(["csv"])
+        self.assertEqual(self.task.results, [("csv", OUTPUTS["csv"])])
+
+    def test_invalid_json_does_not_drop_other_reports(self, download_logs):
+        outputs = dict(OUTPUTS, json="not json")
+        with mock.patch("s3stat.subprocess.Popen", side_effect=fake_popen(outputs)):
+            self.assertFalse(self.task.run(["json", "html"]))
+        self.assertEqual(self.task.results, [("html", OUTPUTS["html"])])
+        self.assertEqual(len(self.task.errors), 1)
+        self.assertIsInstance(self.task.errors[0][0], ValueError)
+
+    def test_goaccess_failure_goes_to_process_error(self, download_logs):
+        with mock.patch("s3stat.subprocess.Popen", side_effect=fake_popen(returncode=1)):
+            self.assertFalse(self.task.run(["html"]))
+        self.assertEqual(self.task.results, [])
+        self.assertIsInstance(self.task.errors[0][0], subprocess.CalledProcessError)
+
+    def test_thread_errors_reach_the_caller(self, download_logs):
+        with mock.patch("s3stat.subprocess.Popen", side_effect=OSError("goaccess not found")):
+            self.assertRaises(OSError, self.task.run, ["html", "json"])
+        self.assertEqual(self.task.results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()